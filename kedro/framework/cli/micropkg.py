@@ -10,17 +10,12 @@ import tarfile
 import tempfile
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Iterable, Iterator, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Tuple, Union
 
 import click
 from build.util import project_wheel_metadata
 from packaging.requirements import InvalidRequirement, Requirement
 from packaging.utils import canonicalize_name
-from rope.base.project import Project
-from rope.contrib import generate
-from rope.refactor.move import MoveModule
-from rope.refactor.rename import Rename
-from setuptools.discovery import FlatLayoutPackageFinder
 
 from kedro.framework.cli.pipeline import (
     _assert_pkg_name_ok,
@@ -36,7 +31,11 @@ from kedro.framework.cli.utils import (
     env_option,
     python_call,
 )
-from kedro.framework.startup import ProjectMetadata
+
+if TYPE_CHECKING:
+    from rope.base.project import Project
+
+    from kedro.framework.startup import ProjectMetadata
 
 _PYPROJECT_TOML_TEMPLATE = """
 [build-system]
@@ -217,6 +216,11 @@ def _pull_package(  # noqa: too-many-arguments
         # without making assumptions on the project metadata.
         library_meta = project_wheel_metadata(project_root_dir)
 
+        # noqa: import-outside-toplevel
+        from setuptools.discovery import (  # for performance reasons
+            FlatLayoutPackageFinder,
+        )
+
         # Project name will be `my-pipeline` even if `pyproject.toml` says `my_pipeline`
         # because standards mandate normalization of names for comparison,
         # see https://packaging.python.org/en/latest/specifications/core-metadata/#name
@@ -274,7 +278,7 @@ def _pull_packages_from_manifest(metadata: ProjectMetadata) -> None:
 
     for package_path, specs in build_specs.items():
         if "alias" in specs:
-            _assert_pkg_name_ok(specs["alias"].split(".")[-1])
+            _assert_pkg_name_ok(specs["alias"].rpartition(".")[2])
         _pull_package(package_path, metadata, **specs)
         click.secho(f"Pulled and unpacked '{package_path}'!")
 
@@ -556,6 +560,9 @@ def _install_files(  # noqa: too-many-arguments, too-many-locals
         # we don't want to copy it again when syncing the package, so we remove it.
         shutil.rmtree(str(conf_source))
 
+    # noqa: import-outside-toplevel
+    from rope.base.project import Project  # for performance reasons
+
     project = Project(source_path)
     refactored_package_source, refactored_test_source = _refactor_code_for_unpacking(
         project, package_source, test_source, alias, destination, project_metadata
@@ -613,7 +620,7 @@ def _package_micropkg(
     destination: str = None,
     env: str = None,
 ) -> Path:
-    micropkg_name = micropkg_module_path.split(".")[-1]
+    micropkg_name = micropkg_module_path.rpartition(".")[2]
     package_dir = metadata.source_dir / metadata.package_name
     env = env or "base"
 
@@ -694,6 +701,9 @@ def _make_install_requires(requirements_txt: Path) -> list[str]:
 
 
 def _create_nested_package(project: Project, package_path: Path) -> Path:
+    # noqa: import-outside-toplevel
+    from rope.contrib import generate  # for performance reasons
+
     # fails if parts of the path exists already
     packages = package_path.parts
     parent = generate.create_package(project, packages[0])
@@ -718,6 +728,9 @@ def _move_package(project: Project, source: str, target: str) -> None:
             qualified module path relative to the `project` root, e.g.
             "package.pipelines.pipeline" or "package/pipelines/pipeline".
     """
+    # noqa: import-outside-toplevel
+    from rope.refactor.move import MoveModule  # for performance reasons
+
     src_folder = project.get_module(source).get_resource()
     target_folder = project.get_module(target).get_resource()
     change = MoveModule(project, src_folder).get_changes(dest=target_folder)
@@ -736,6 +749,9 @@ def _rename_package(project: Project, old_name: str, new_name: str) -> None:
             relative to the `project` root.
         new_name: New module name. Can't be a fully qualified module path.
     """
+    # noqa: import-outside-toplevel
+    from rope.refactor.rename import Rename  # for performance reasons
+
     folder = project.get_folder(old_name)
     change = Rename(project, folder).get_changes(new_name, docs=True)
     project.do(change)
@@ -838,6 +854,9 @@ def _generate_sdist_file(  # noqa: too-many-arguments,too-many-locals
     package_name = alias or micropkg_name
     package_source, tests_source, conf_source = source_paths
 
+    # noqa: import-outside-toplevel
+    from rope.base.project import Project  # for performance reasons
+
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_dir_path = Path(temp_dir).resolve()
 
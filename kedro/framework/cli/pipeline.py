@@ -1,11 +1,15 @@
 """A collection of CLI commands for working with Kedro pipelines."""
 from __future__ import annotations
 
+import os
 import re
 import shutil
+import string
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import indent
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
 import click
 
@@ -17,8 +21,9 @@ from kedro.framework.cli.utils import (
     command_with_verbosity,
     env_option,
 )
-from kedro.framework.project import settings
-from kedro.framework.startup import ProjectMetadata
+
+if TYPE_CHECKING:
+    from kedro.framework.startup import ProjectMetadata
 
 _SETUP_PY_TEMPLATE = """# -*- coding: utf-8 -*-
 from setuptools import setup, find_packages
@@ -33,6 +38,13 @@ setup(
 )
 """
 
+_cookiecutter = None
+
+_MAX_DELETE_WORKERS = 8
+
+_PKG_NAME_FIRST_CHARS = frozenset(string.ascii_letters + "_")
+_PKG_NAME_RE = re.compile(r"[A-Za-z_]\w*")
+
 
 class PipelineArtifacts(NamedTuple):
     """An ordered collection of source_path, tests_path, config_paths"""
@@ -53,13 +65,13 @@ def _assert_pkg_name_ok(pkg_name: str):
     """
 
     base_message = f"'{pkg_name}' is not a valid Python package name."
-    if not re.match(r"^[a-zA-Z_]", pkg_name):
+    if not pkg_name or pkg_name[0] not in _PKG_NAME_FIRST_CHARS:
         message = base_message + " It must start with a letter or underscore."
         raise KedroCliError(message)
     if len(pkg_name) < 2:  # noqa: PLR2004
         message = base_message + " It must be at least 2 characters long."
         raise KedroCliError(message)
-    if not re.match(r"^\w+$", pkg_name[1:]):
+    if not _PKG_NAME_RE.fullmatch(pkg_name):
         message = (
             base_message + " It must contain only letters, digits, and/or underscores."
         )
@@ -103,6 +115,9 @@ def create_pipeline(
     metadata: ProjectMetadata, name, template_path, skip_config, env, **kwargs
 ):  # noqa: unused-argument
     """Create a new modular pipeline by providing a name."""
+    # noqa: import-outside-toplevel
+    from kedro.framework.project import settings
+
     package_dir = metadata.source_dir / metadata.package_name
     conf_source = settings.CONF_SOURCE
     project_conf_path = metadata.project_path / conf_source
@@ -145,6 +160,9 @@ def delete_pipeline(
     metadata: ProjectMetadata, name, env, yes, **kwargs
 ):  # noqa: unused-argument
     """Delete a modular pipeline by providing a name."""
+    # noqa: import-outside-toplevel
+    from kedro.framework.project import settings
+
     package_dir = metadata.source_dir / metadata.package_name
     conf_source = settings.CONF_SOURCE
     project_conf_path = metadata.project_path / conf_source
@@ -156,15 +174,21 @@ def delete_pipeline(
             f"Make sure it exists in the project configuration."
         )
 
-    pipeline_artifacts = _get_pipeline_artifacts(metadata, pipeline_name=name, env=env)
+    pipeline_artifacts = _get_pipeline_artifacts(
+        package_dir, project_conf_path, pipeline_name=name, env=env
+    )
 
+    conf_dir = pipeline_artifacts.pipeline_conf
     files_to_delete = [
-        pipeline_artifacts.pipeline_conf / filepath
+        filepath
         for confdir in ("parameters", "catalog")
         # Since we remove nesting in 'parameters' and 'catalog' folders,
         # we want to also del the old project's structure for backward compatibility
-        for filepath in (Path(f"{confdir}_{name}.yml"), Path(confdir) / f"{name}.yml")
-        if (pipeline_artifacts.pipeline_conf / filepath).is_file()
+        for filepath in (
+            conf_dir / f"{confdir}_{name}.yml",
+            conf_dir / confdir / f"{name}.yml",
+        )
+        if filepath.is_file()
     ]
 
     dirs_to_delete = [
@@ -210,11 +234,20 @@ def _echo_deletion_warning(message: str, **paths: list[Path]):
         click.echo(indent(paths_str, " " * 2))
 
 
-def _create_pipeline(name: str, template_path: Path, output_dir: Path) -> Path:
-    with _filter_deprecation_warnings():
-        # noqa: import-outside-toplevel
-        from cookiecutter.main import cookiecutter
+def _get_cookiecutter():
+    """Import ``cookiecutter`` on first use and return the cached function after."""
+    global _cookiecutter  # noqa: PLW0603
+    if _cookiecutter is None:
+        with _filter_deprecation_warnings():
+            # noqa: import-outside-toplevel
+            from cookiecutter.main import cookiecutter
 
+        _cookiecutter = cookiecutter
+    return _cookiecutter
+
+
+def _create_pipeline(name: str, template_path: Path, output_dir: Path) -> Path:
+    cookiecutter = _get_cookiecutter()
     cookie_context = {"pipeline_name": name, "kedro_version": kedro.__version__}
 
     click.echo(f"Creating the pipeline '{name}': ", nl=False)
@@ -249,56 +282,117 @@ def _sync_dirs(source: Path, target: Path, prefix: str = "", overwrite: bool = F
         unless overwrite=True.
         2) Copy all files from source to target.
         3) Recursively copy all directories from source to target.
+    If `target` does not exist yet, the whole `source` directory is copied at once,
+    including any empty directories in it.
 
     Args:
         source: A local directory to copy from, must exist.
         target: A local directory to copy to, will be created if doesn't exist yet.
         prefix: Prefix for CLI message indentation.
+        overwrite: Whether to overwrite existing files at the top level of `target`.
     """
+    # status lines are collected and written in one go to avoid a terminal
+    # write per copied file
+    report: list[str] = []
+    # directories left to sync as (source, target, prefix, nested);
+    # paths are kept as strings, ``Path`` is only used at the function boundary
+    stack = deque([(os.fspath(source), os.fspath(target), prefix, False)])
+    try:
+        while stack:
+            src, tgt, pfx, nested = stack.pop()
+            if nested and os.path.exists(tgt):
+                # merging into an existing directory, list its entries below it
+                report.append(indent(f"Creating '{tgt}': ", pfx))
+                pfx = pfx + " " * 2
+            subdirs = _sync_dir_contents(src, tgt, pfx, overwrite, report)
+            # ``overwrite`` only applies to the top level of ``target``
+            overwrite = False
+            # reversed, so that subdirectories are synced in listing order
+            stack.extend(reversed(subdirs))
+    finally:
+        if report:
+            click.echo("\n".join(report))
 
-    existing = list(target.iterdir()) if target.is_dir() else []
-    existing_files = {f.name for f in existing if f.is_file()}
-    existing_folders = {f.name for f in existing if f.is_dir()}
 
-    if source.is_dir():
-        content = list(source.iterdir())
-    elif source.is_file():
-        content = [source]
+def _sync_dir_contents(
+    src: str, tgt: str, pfx: str, ovw: bool, report: list[str]
+) -> list[tuple[str, str, str, bool]]:
+    """Syncs the direct children of `src` into `tgt` following the rules of
+    ``_sync_dirs``, appending a status line per entry to `report`.
+
+    Returns:
+        The subdirectories of `src` left to sync, as ``_sync_dirs`` stack entries.
+    """
+    # bind the helpers used once per entry to locals for cheaper lookups
+    style = click.style
+    copyfile = shutil.copyfile
+    join = os.path.join
+
+    src_is_dir = os.path.isdir(src)
+    if src_is_dir and not os.path.exists(tgt):
+        # nothing to merge with, so copy the whole tree in one go
+        _copy_tree(src, tgt, indent(f"Creating '{tgt}': ", pfx), report)
+        return []
+
+    existing_files = set()
+    existing_folders = set()
+    if os.path.isdir(tgt):
+        with os.scandir(tgt) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    existing_files.add(entry.name)
+                elif entry.is_dir():
+                    existing_folders.add(entry.name)
+
+    if src_is_dir:
+        # ``os.DirEntry`` caches the file type, so no extra ``stat`` per entry
+        with os.scandir(src) as entries:
+            content = [(e.name, e.path, e.is_file()) for e in entries]
+    elif os.path.isfile(src):
+        content = [(os.path.basename(src), src, True)]
     else:
         # nothing to copy
         content = []  # pragma: no cover
 
-    for source_path in content:
-        source_name = source_path.name
-        target_path = target / source_name
-        click.echo(indent(f"Creating '{target_path}': ", prefix), nl=False)
+    subdirs = []
+    for source_name, source_path, is_file in content:
+        target_path = join(tgt, source_name)
+        message = indent(f"Creating '{target_path}': ", pfx)
 
         if (  # rule #1
-            not overwrite
+            not ovw
             and source_name in existing_files
-            or source_path.is_file()
+            or is_file
             and source_name in existing_folders
         ):
-            click.secho("SKIPPED (already exists)", fg="yellow")
-        elif source_path.is_file():  # rule #2
+            report.append(message + style("SKIPPED (already exists)", fg="yellow"))
+        elif is_file:  # rule #2
             try:
-                target.mkdir(exist_ok=True, parents=True)
-                shutil.copyfile(str(source_path), str(target_path))
+                os.makedirs(tgt, exist_ok=True)
+                copyfile(source_path, target_path)
             except Exception:
-                click.secho("FAILED", fg="red")
+                report.append(message + style("FAILED", fg="red"))
                 raise
-            click.secho("OK", fg="green")
+            report.append(message + style("OK", fg="green"))
         else:  # source_path is a directory, rule #3
-            click.echo()
-            new_prefix = (prefix or "") + " " * 2
-            _sync_dirs(source_path, target_path, prefix=new_prefix)
+            subdirs.append((source_path, target_path, pfx, True))
+    return subdirs
+
+
+def _copy_tree(src: str, tgt: str, message: str, report: list[str]):
+    try:
+        shutil.copytree(src, tgt, copy_function=shutil.copyfile)
+    except Exception:
+        report.append(message + click.style("FAILED", fg="red"))
+        raise
+    report.append(message + click.style("OK", fg="green"))
 
 
 def _get_pipeline_artifacts(
-    project_metadata: ProjectMetadata, pipeline_name: str, env: str
+    package_dir: Path, project_conf_path: Path, pipeline_name: str, env: str
 ) -> PipelineArtifacts:
-    artifacts = _get_artifacts_to_package(
-        project_metadata, f"pipelines.{pipeline_name}", env
+    artifacts = _artifact_paths(
+        package_dir, project_conf_path, f"pipelines.{pipeline_name}", env
     )
     return PipelineArtifacts(*artifacts)
 
@@ -307,23 +401,61 @@ def _get_artifacts_to_package(
     project_metadata: ProjectMetadata, module_path: str, env: str
 ) -> tuple[Path, Path, Path]:
     """From existing project, returns in order: source_path, tests_path, config_paths"""
-    package_dir = project_metadata.source_dir / project_metadata.package_name
-    project_conf_path = project_metadata.project_path / settings.CONF_SOURCE
+    # noqa: import-outside-toplevel
+    from kedro.framework.project import settings
+
+    return _artifact_paths(
+        project_metadata.source_dir / project_metadata.package_name,
+        project_metadata.project_path / settings.CONF_SOURCE,
+        module_path,
+        env,
+    )
+
+
+def _artifact_paths(
+    package_dir: Path, project_conf_path: Path, module_path: str, env: str
+) -> tuple[Path, Path, Path]:
+    module_parts = module_path.split(".")
     artifacts = (
-        Path(package_dir, *module_path.split(".")),
-        Path(package_dir.parent, "tests", *module_path.split(".")),
+        Path(package_dir, *module_parts),
+        Path(package_dir.parent, "tests", *module_parts),
         project_conf_path / env,
     )
     return artifacts
 
 
+def _move_or_sync_dirs(source: Path, target: Path):
+    """Moves `source` directory to `target` if the latter doesn't exist yet, which
+    is a single rename on the same filesystem. Otherwise merges `source` into
+    `target` using ``_sync_dirs``.
+
+    Args:
+        source: A local directory to move from, must exist.
+        target: A local directory to move or copy to.
+    """
+    if target.exists():
+        _sync_dirs(source, target)
+        return
+
+    message = f"Creating '{target}': "
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # falls back to copy and delete if `target` is on another filesystem
+        shutil.move(source, target)
+    except Exception:
+        click.echo(message + click.style("FAILED", fg="red"))
+        raise
+    click.echo(message + click.style("OK", fg="green"))
+
+
 def _copy_pipeline_tests(pipeline_name: str, result_path: Path, package_dir: Path):
     tests_source = result_path / "tests"
     tests_target = package_dir.parent / "tests" / "pipelines" / pipeline_name
     try:
-        _sync_dirs(tests_source, tests_target)
+        _move_or_sync_dirs(tests_source, tests_target)
     finally:
-        shutil.rmtree(tests_source)
+        if tests_source.exists():
+            shutil.rmtree(tests_source)
 
 
 def _copy_pipeline_configs(
@@ -333,21 +465,36 @@ def _copy_pipeline_configs(
     try:
         if not skip_config:
             config_target = conf_path / env
-            _sync_dirs(config_source, config_target)
+            _move_or_sync_dirs(config_source, config_target)
     finally:
-        shutil.rmtree(config_source)
+        if config_source.exists():
+            shutil.rmtree(config_source)
 
 
 def _delete_artifacts(*artifacts: Path):
-    for artifact in artifacts:
-        click.echo(f"Deleting '{artifact}': ", nl=False)
-        try:
-            if artifact.is_dir():
-                shutil.rmtree(artifact)
+    # deletions are I/O bound, so they can overlap across threads,
+    # but results are reported in the order the artifacts were given
+    max_workers = min(_MAX_DELETE_WORKERS, len(artifacts)) or 1
+    error = None
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_delete_artifact, artifact) for artifact in artifacts]
+        for artifact, future in zip(artifacts, futures):
+            message = f"Deleting '{artifact}': "
+            try:
+                future.result()
+            except Exception as exc:  # noqa: broad-except
+                click.echo(message + click.style("FAILED", fg="red"))
+                error = error or exc
             else:
-                artifact.unlink()
-        except Exception as exc:
-            click.secho("FAILED", fg="red")
-            cls = exc.__class__
-            raise KedroCliError(f"{cls.__module__}.{cls.__qualname__}: {exc}") from exc
-        click.secho("OK", fg="green")
+                click.echo(message + click.style("OK", fg="green"))
+
+    if error:
+        cls = error.__class__
+        raise KedroCliError(f"{cls.__module__}.{cls.__qualname__}: {error}") from error
+
+
+def _delete_artifact(artifact: Path):
+    if artifact.is_dir():
+        shutil.rmtree(artifact)
+    else:
+        artifact.unlink()
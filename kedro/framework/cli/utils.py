@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import difflib
 import logging
+import os
 import re
 import shlex
 import shutil
@@ -285,10 +286,12 @@ def _clean_pycache(path: Path):
     Args:
         path: Existing local directory to clean __pycache__ folders from.
     """
-    to_delete = [each.resolve() for each in path.rglob("__pycache__")]
-
-    for each in to_delete:
-        shutil.rmtree(each, ignore_errors=True)
+    # walk the tree once and prune __pycache__ folders as they are found,
+    # so their contents are never listed
+    for dirpath, dirnames, _ in os.walk(path.resolve()):
+        if "__pycache__" in dirnames:
+            dirnames.remove("__pycache__")
+            shutil.rmtree(Path(dirpath, "__pycache__"), ignore_errors=True)
 
 
 def split_string(ctx, param, value):  # noqa: unused-argument
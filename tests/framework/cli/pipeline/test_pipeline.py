@@ -259,6 +259,42 @@ class TestPipelineCreateCommand:
         pipelines_dir = fake_package_path / "pipelines"
         assert (pipelines_dir / PIPELINE_NAME / "pipeline.py").is_file()
 
+    def test_failed_move(
+        self, fake_repo_path, fake_project_cli, fake_metadata, fake_package_path, mocker
+    ):
+        """Test the error if moving the pipeline tests into place fails"""
+        error = Exception("Mock exception")
+        mocker.patch("shutil.move", side_effect=error)
+
+        cmd = ["pipeline", "create", PIPELINE_NAME]
+        result = CliRunner().invoke(fake_project_cli, cmd, obj=fake_metadata)
+        assert result.exit_code
+        assert result.exception is error
+
+        tests_target = fake_repo_path / "src" / "tests" / "pipelines" / PIPELINE_NAME
+        assert f"Creating '{tests_target}': FAILED" in result.output
+        assert not tests_target.exists()
+
+        # the rendered tests are cleaned up from the new pipeline anyways
+        result_path = fake_package_path / "pipelines" / PIPELINE_NAME
+        assert (result_path / "pipeline.py").is_file()
+        assert not (result_path / "tests").exists()
+
+    def test_tests_target_exists(self, fake_repo_path, fake_project_cli, fake_metadata):
+        """Test that the pipeline tests are merged into an existing tests folder"""
+        tests_target = fake_repo_path / "src" / "tests" / "pipelines" / PIPELINE_NAME
+        tests_target.mkdir(parents=True)
+
+        cmd = ["pipeline", "create", PIPELINE_NAME]
+        result = CliRunner().invoke(fake_project_cli, cmd, obj=fake_metadata)
+
+        assert result.exit_code == 0
+        assert f"Creating '{tests_target}': OK" not in result.output
+        assert f"Creating '{tests_target / '__init__.py'}': OK" in result.output
+        assert f"Creating '{tests_target / 'test_pipeline.py'}': OK" in result.output
+        actual_files = {f.name for f in tests_target.iterdir()}
+        assert actual_files == {"__init__.py", "test_pipeline.py"}
+
     def test_no_pipeline_arg_error(
         self, fake_project_cli, fake_metadata, fake_package_path
     ):
@@ -291,6 +327,16 @@ class TestPipelineCreateCommand:
         assert result.exit_code
         assert error_message in result.output
 
+    def test_help_skips_name_validation(self, fake_project_cli, fake_metadata, mocker):
+        """Test that `--help` exits before the pipeline name is validated"""
+        mocked_check = mocker.patch("kedro.framework.cli.pipeline._assert_pkg_name_ok")
+        cmd = ["pipeline", "create", "1bad", "--help"]
+        result = CliRunner().invoke(fake_project_cli, cmd, obj=fake_metadata)
+
+        assert result.exit_code == 0
+        assert "Create a new modular pipeline" in result.output
+        mocked_check.assert_not_called()
+
     def test_duplicate_pipeline_name(
         self, fake_project_cli, fake_metadata, fake_package_path
     ):
@@ -415,6 +461,46 @@ class TestPipelineDeleteCommand:
         assert result.exit_code, result.output
         assert f"Deleting '{source_path}': FAILED" in result.output
 
+    def test_delete_pipeline_fail_reports_in_order(
+        self, fake_repo_path, fake_project_cli, fake_metadata, fake_package_path, mocker
+    ):
+        """Test that a failed deletion does not stop the others and that all
+        results are reported in the order the paths were listed"""
+        source_path = fake_package_path / "pipelines" / PIPELINE_NAME
+        tests_path = fake_repo_path / "src" / "tests" / "pipelines" / PIPELINE_NAME
+        conf_path = fake_repo_path / settings.CONF_SOURCE / "base"
+        params_path = conf_path / f"parameters_{PIPELINE_NAME}.yml"
+        old_params_path = conf_path / "parameters" / f"{PIPELINE_NAME}.yml"
+
+        rmtree = shutil.rmtree
+
+        def _rmtree(path, *args, **kwargs):
+            if Path(path) == source_path:
+                raise PermissionError("permission")
+            rmtree(path, *args, **kwargs)
+
+        mocker.patch("kedro.framework.cli.pipeline.shutil.rmtree", side_effect=_rmtree)
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["pipeline", "delete", "-y", PIPELINE_NAME],
+            obj=fake_metadata,
+        )
+
+        assert result.exit_code, result.output
+        expected_lines = [
+            f"Deleting '{params_path}': OK",
+            f"Deleting '{old_params_path}': OK",
+            f"Deleting '{source_path}': FAILED",
+            f"Deleting '{tests_path}': OK",
+        ]
+        actual_lines = [
+            line for line in result.output.splitlines() if line.startswith("Deleting")
+        ]
+        assert actual_lines == expected_lines
+        assert source_path.is_dir()
+        assert not tests_path.exists()
+        assert not params_path.exists()
+
     @pytest.mark.parametrize(
         "bad_name,error_message",
         [
@@ -580,3 +666,36 @@ class TestSyncDirs:
         assert (target / "existing" / "common").read_text(encoding="utf-8") == "source"
         assert not (target / "existing" / "target_file").exists()
         assert (target / "new" / "source_file").is_file()
+
+    def test_sync_no_target_copy_fails(self, source, tmp_path, mocker, capsys):
+        """Test _sync_dirs reports a failed copy if target doesn't exist."""
+        error = Exception("Mock exception")
+        mocker.patch("shutil.copyfile", side_effect=error)
+        target = Path(tmp_path) / "target"
+
+        with pytest.raises(Exception, match="Mock exception"):
+            _sync_dirs(source, target)
+
+        output = capsys.readouterr().out
+        assert output.splitlines() == [f"Creating '{target}': FAILED"]
+
+    def test_sync_no_target_empty_dirs(self, source, tmp_path):
+        """Test _sync_dirs copies empty directories if target doesn't exist."""
+        (source / "empty").mkdir()
+        target = Path(tmp_path) / "target"
+
+        _sync_dirs(source, target)
+
+        assert (target / "empty").is_dir()
+        assert not list((target / "empty").iterdir())
+
+    def test_sync_empty_source_no_target(self, tmp_path):
+        """Test _sync_dirs creates the target for an empty source directory."""
+        source = Path(tmp_path) / "empty_source"
+        source.mkdir()
+        target = Path(tmp_path) / "target"
+
+        _sync_dirs(source, target)
+
+        assert target.is_dir()
+        assert not list(target.iterdir())